@@ -19,6 +19,47 @@ import numbers
 import sys
 
 
+# Cache mapping tensor types to the TensorBox subclass used to wrap them
+_BOX_BY_TYPE = {}
+
+
+def _get_box_class(tensor):
+    """Returns the TensorBox subclass corresponding to the type of the input tensor.
+
+    Args:
+        tensor (tensor_like): array-like object to be wrapped
+
+    Returns:
+        type: the TensorBox subclass supporting the tensor
+
+    Raises:
+        ValueError: if the tensor type is not supported
+    """
+    namespace = tensor.__class__.__module__.split(".")[0]
+
+    if isinstance(tensor, (numbers.Number, list, tuple)) or namespace == "numpy":
+        from .numpy_box import NumpyBox
+
+        return NumpyBox
+
+    if namespace in ("pennylane", "autograd"):
+        from .autograd_box import AutogradBox
+
+        return AutogradBox
+
+    if namespace == "tensorflow":
+        from .tf_box import TensorFlowBox
+
+        return TensorFlowBox
+
+    if namespace == "torch":
+        from .torch_box import TorchBox
+
+        return TorchBox
+
+    raise ValueError(f"Unknown tensor type {type(tensor)}")
+
+
 def wrap_output(func):
     """Decorator to automate the wrapping of TensorBox method outputs.
 
@@ -29,12 +70,19 @@ def wrap_output(func):
     underlying tensor itself being returned.
     """
 
+    cls = None
+
     @functools.wraps(func)
     def _wrapper(*args, **kwargs):
+        nonlocal cls
         wrap = kwargs.pop("wrap_output", True)
 
         if wrap:
-            cls = vars(sys.modules[func.__module__])[func.__qualname__.split(".")[0]]
+            if cls is None:
+                # The class does not yet exist when the decorator is applied,
+                # so it is resolved on the first call and reused afterwards.
+                cls = vars(sys.modules[func.__module__])[func.__qualname__.split(".")[0]]
+
             return cls(func(*args, **kwargs))
 
         return func(*args, **kwargs)
@@ -103,29 +151,16 @@ class TensorBox(abc.ABC):
         if cls is not TensorBox:
             return super(TensorBox, cls).__new__(cls)
 
-        namespace = tensor.__class__.__module__.split(".")[0]
-
-        if isinstance(tensor, (numbers.Number, list, tuple)) or namespace == "numpy":
-            from .numpy_box import NumpyBox
-
-            return NumpyBox.__new__(NumpyBox, tensor)
-
-        if namespace in ("pennylane", "autograd"):
-            from .autograd_box import AutogradBox
-
-            return AutogradBox.__new__(AutogradBox, tensor)
-
-        if namespace == "tensorflow":
-            from .tf_box import TensorFlowBox
-
-            return TensorFlowBox.__new__(TensorFlowBox, tensor)
-
-        if namespace == "torch":
-            from .torch_box import TorchBox
+        # the subclass only depends on the tensor type, so it is
+        # only determined once per type and then looked up
+        tensor_type = type(tensor)
+        box_cls = _BOX_BY_TYPE.get(tensor_type)
 
-            return TorchBox.__new__(TorchBox, tensor)
+        if box_cls is None:
+            box_cls = _get_box_class(tensor)
+            _BOX_BY_TYPE[tensor_type] = box_cls
 
-        raise ValueError(f"Unknown tensor type {type(tensor)}")
+        return box_cls.__new__(box_cls, tensor)
 
     def __init__(self, tensor):
         if self._initialized:
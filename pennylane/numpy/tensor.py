@@ -116,6 +116,26 @@ class tensor(_np.ndarray):
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         # pylint: disable=no-member,attribute-defined-outside-init
 
+        if ufunc.nout == 1 and not kwargs.get("out"):
+            # Fast path for the common case of a single output that
+            # is not provided by the caller, such as arithmetic operators.
+            # The inputs are unwrapped and checked for trainability in a single pass.
+            args = []
+            requires_grad = False
+
+            for x in inputs:
+                if not requires_grad and isinstance(x, onp.ndarray):
+                    requires_grad = bool(getattr(x, "requires_grad", True))
+
+                args.append(x.unwrap() if hasattr(x, "unwrap") else x)
+
+            res = super().__array_ufunc__(ufunc, method, *args, **kwargs)
+
+            # the result is newly allocated, so it can be viewed as a tensor without copying
+            res = onp.asarray(res).view(tensor)
+            res.requires_grad = requires_grad
+            return res
+
         # unwrap any outputs the ufunc might have
         outputs = [i.view(onp.ndarray) for i in kwargs.get("out", ())]
 
@@ -14,6 +14,8 @@
 r"""
 Contains the ``MottonenStatePreparation`` template.
 """
+import functools
+
 import numpy as np
 
 import pennylane as qml
@@ -24,6 +26,15 @@ from pennylane.variable import Variable
 from pennylane.wires import Wires
 
 
+# Lookup table mapping the top five bits of ``(2**i * 0x077CB531) mod 2**32`` to ``i``
+# fmt: off
+_DEBRUIJN_BIT_POSITION = np.array([
+    0, 1, 28, 2, 29, 14, 24, 3, 30, 22, 20, 15, 25, 17, 4, 8,
+    31, 27, 13, 23, 21, 19, 16, 7, 26, 12, 18, 6, 11, 5, 10, 9,
+])
+# fmt: on
+
+
 # pylint: disable=len-as-condition,arguments-out-of-order,consider-using-enumerate
 def gray_code(rank):
     """Generates the Gray code of given rank.
@@ -51,51 +62,124 @@ def gray_code(rank):
     return g
 
 
-def _matrix_M_entry(row, col):
-    """Returns one entry for the matrix that maps alpha to theta.
+def gray_code_int(rank):
+    r"""Generates the Gray code of given rank as an array of integers.
+
+    The :math:`i`-th codeword is given by ``i ^ (i >> 1)``.
+
+    Args:
+        rank (int): rank of the Gray code (i.e. number of bits)
+
+    Returns:
+        (array[int]): the :math:`2^{\text{rank}}` codewords in Gray code order
+    """
+    i = np.arange(1 << rank, dtype=np.uint32)
+    return i ^ (i >> 1)
+
+
+def _bit_position(x):
+    """Returns the position of the single set bit in each entry of an integer array.
 
-    See Eq. (3) in `Möttönen et al. (2004) <https://arxiv.org/pdf/quant-ph/0407010.pdf>`_.
+    The position is found via a multiplication by a de Bruijn sequence followed
+    by a table lookup, avoiding any floating point logarithms.
 
     Args:
-        row (int): one-based row number
-        col (int): one-based column number
+        x (array[int]): powers of two smaller than :math:`2^{32}`
 
     Returns:
-        (float): transformation matrix entry at given row and column
+        (array[int]): base-2 logarithm of each entry
     """
-    # (col >> 1) ^ col is the Gray code of col
-    b_and_g = row & ((col >> 1) ^ col)
-    sum_of_ones = 0
-    while b_and_g > 0:
-        if b_and_g & 0b1:
-            sum_of_ones += 1
+    v = np.asarray(x, dtype=np.uint32)
+    return _DEBRUIJN_BIT_POSITION[(v * np.uint32(0x077CB531)) >> 27]
+
+
+def _fwht(x):
+    r"""Applies the fast Walsh-Hadamard transform to a vector.
+
+    The transform is equivalent to multiplying by the (unnormalized) Hadamard matrix in
+    natural order, whose entry :math:`(i, j)` is :math:`(-1)^{i \cdot j}` with :math:`i \cdot j`
+    the bitwise inner product, but only requires :math:`\mathcal{O}(N \log N)` additions.
+
+    Plain NumPy arrays are transformed in place on a copy of the input. Any other tensor,
+    including a PennyLane NumPy ``tensor``, is transformed using only slicing, addition,
+    subtraction and :func:`~.math.concatenate`, so that it stays in its native framework
+    and keeps its trainability.
+
+    Args:
+        x (tensor_like): vector of length :math:`N`, a power of two
+
+    Returns:
+        tensor_like: transformed vector
+    """
+    ln = int(x.shape[0])
+
+    if isinstance(x, np.ndarray) and not isinstance(x, qml.numpy.tensor):
+        res = np.array(x, dtype=float)
 
-        b_and_g = b_and_g >> 1
+        h = 1
+        while h < ln:
+            # view the vector as pairs of blocks of length h and apply the butterfly in place
+            blocks = res.reshape(-1, 2, h)
+            first = blocks[:, 0].copy()
+            blocks[:, 0] += blocks[:, 1]
+            blocks[:, 1] = first - blocks[:, 1]
+            h *= 2
 
-    return (-1) ** sum_of_ones
+        return res
+
+    for _ in range(ln.bit_length() - 1):
+        # Transform the least significant bit of the index and move it to the front.
+        # After log2(N) steps, every bit has been transformed and is back in its original place.
+        even, odd = x[0::2], x[1::2]
+        x = qml.math.concatenate([even + odd, even - odd])
+
+    return x
+
+
+@functools.lru_cache(maxsize=64)
+def _control_indices(rank):
+    """Returns the indices of the control wires of the CNOTs in the Gray code
+    implementation of a uniformly-controlled rotation.
+
+    The result only depends on the number of control wires and is therefore cached.
+
+    Args:
+        rank (int): rank of the Gray code (i.e. number of control wires)
+
+    Returns:
+        tuple[int]: index of the control wire of each CNOT
+    """
+    codes = gray_code_int(rank)
+
+    # successive codewords differ in exactly one bit, the position of which
+    # determines the control wire of the corresponding CNOT
+    return tuple(_bit_position(codes ^ np.roll(codes, -1)).tolist())
 
 
 def _compute_theta(alpha):
     """Maps the angles alpha of the multi-controlled rotations decomposition of a uniformly controlled rotation
      to the rotation angles used in the Gray code implementation.
 
+    The transformation matrix is given by Eq. (3) in
+    `Möttönen et al. (2004) <https://arxiv.org/pdf/quant-ph/0407010.pdf>`_. Its :math:`i`-th row
+    is the row of the Hadamard matrix indexed by the Gray code of :math:`i`, so that the
+    matrix-vector product can be computed with a fast Walsh-Hadamard transform.
+
     Args:
-        alpha (array[float]): alpha parameters
+        alpha (tensor_like): alpha parameters
 
     Returns:
-        (array[float]): rotation angles theta
+        tensor_like: rotation angles theta, in the same interface as alpha
     """
-    ln = alpha.shape[0]
-    k = np.log2(alpha.shape[0])
+    ln = int(alpha.shape[0])
+    k = ln.bit_length() - 1
 
-    M_trans = np.zeros(shape=(ln, ln))
-    for i in range(len(M_trans)):
-        for j in range(len(M_trans[0])):
-            M_trans[i, j] = _matrix_M_entry(j, i)
+    codes = gray_code_int(k)
 
-    theta = M_trans @ alpha
+    if isinstance(alpha, np.ndarray) and not isinstance(alpha, qml.numpy.tensor):
+        return _fwht(alpha)[codes] / ln
 
-    return theta / 2 ** k
+    return qml.math.take(_fwht(alpha), codes.astype(np.int64)) / ln
 
 
 def _uniform_rotation_dagger(gate, alpha, control_wires, target_wire):
@@ -122,93 +206,100 @@ def _uniform_rotation_dagger(gate, alpha, control_wires, target_wire):
 
     theta = _compute_theta(alpha)
 
+    # evaluate which rotations can be skipped in a single vectorized comparison
+    nonzero = (qml.math.toarray(theta) != 0.0).tolist()
+
+    control_wires = Wires(control_wires)
+    target_wire = Wires(target_wire)
     gray_code_rank = len(control_wires)
 
     if gray_code_rank == 0:
-        if theta[0] != 0.0:
-            gate(theta[0], wires=[target_wire])
+        if nonzero[0]:
+            gate(theta[0], wires=target_wire)
         return
 
-    code = gray_code(gray_code_rank)
-    num_selections = len(code)
+    control_indices = _control_indices(gray_code_rank)
 
-    control_indices = [
-        int(np.log2(int(code[i], 2) ^ int(code[(i + 1) % num_selections], 2)))
-        for i in range(num_selections)
-    ]
+    # construct the wires of the CNOTs once per control wire,
+    # instead of once per gate
+    cnot_wires = [Wires([control_wires[j], target_wire]) for j in range(gray_code_rank)]
 
     for i, control_index in enumerate(control_indices):
-        if theta[i] != 0.0:
-            gate(theta[i], wires=[target_wire])
-        qml.CNOT(wires=[control_wires[control_index], target_wire])
+        if nonzero[i]:
+            gate(theta[i], wires=target_wire)
+        qml.CNOT(wires=cnot_wires[control_index])
 
 
-def _get_alpha_z(omega, n, k):
-    r"""Computes the rotation angles required to implement the uniformly-controlled Z rotation
-    applied to the :math:`k`th qubit.
+def _get_alpha_z(omega, n):
+    r"""Computes the rotation angles required to implement the uniformly-controlled Z rotations
+    applied to all qubits.
 
-    The :math:`j`th angle is related to the phases omega of the desired amplitudes via:
+    For the :math:`k`th qubit, the :math:`j`th angle is related to the phases omega of the
+    desired amplitudes via:
 
     .. math:: \alpha^{z,k}_j = \sum_{l=1}^{2^{k-1}} \frac{\omega_{(2j-1) 2^{k-1}+l} - \omega_{(2j-2) 2^{k-1}+l}}{2^{k-1}}
 
+    The angles of all qubits are computed in a single pass, by successively summing
+    neighbouring pairs of phases to obtain the sums over blocks of size :math:`2^{k}`.
+
     Args:
         omega (array): phases of the state to prepare
         n (int): total number of qubits for the uniformly-controlled rotation
-        k (int): index of current qubit
 
     Returns:
-        array representing :math:`\alpha^{z,k}`
+        list[array]: the :math:`k-1`th entry represents :math:`\alpha^{z,k}`
     """
-    indices1 = [
-        [(2 * j - 1) * 2 ** (k - 1) + l - 1 for l in range(1, 2 ** (k - 1) + 1)]
-        for j in range(1, 2 ** (n - k) + 1)
-    ]
-    indices2 = [
-        [(2 * j - 2) * 2 ** (k - 1) + l - 1 for l in range(1, 2 ** (k - 1) + 1)]
-        for j in range(1, 2 ** (n - k) + 1)
-    ]
+    sums = omega
+    alphas = []
 
-    term1 = np.take(omega, indices=indices1)
-    term2 = np.take(omega, indices=indices2)
-    diff = (term1 - term2) / 2 ** (k - 1)
+    # size 2^(k-1) of the half blocks, doubled at each level
+    half = 1
 
-    return np.sum(diff, axis=1)
+    for _ in range(n):
+        # each row contains the sums over the two halves of a block of size 2^k
+        pairs = np.reshape(sums, (-1, 2))
+        alphas.append((pairs[:, 1] - pairs[:, 0]) / half)
+        sums = np.sum(pairs, axis=1)
+        half <<= 1
 
+    return alphas
 
-def _get_alpha_y(a, n, k):
-    r"""Computes the rotation angles required to implement the uniformly controlled Y rotation
-    applied to the :math:`k`th qubit.
 
-    The :math:`j`-th angle is related to the absolute values, a, of the desired amplitudes via:
+def _get_alpha_y(a_sq, n):
+    r"""Computes the rotation angles required to implement the uniformly controlled Y rotations
+    applied to all qubits.
+
+    For the :math:`k`th qubit, the :math:`j`-th angle is related to the absolute values, a,
+    of the desired amplitudes via:
 
     .. math:: \alpha^{y,k}_j = 2 \arcsin \sqrt{ \frac{ \sum_{l=1}^{2^{k-1}} a_{(2j-1)2^{k-1} +l}^2  }{ \sum_{l=1}^{2^{k}} a_{(j-1)2^{k} +l}^2  } }
 
+    The angles of all qubits are computed in a single pass, by successively summing
+    neighbouring pairs of squared absolute values to obtain the sums over blocks of size :math:`2^{k}`.
+
     Args:
-        a (array): absolute values of the state to prepare
+        a_sq (array): squared absolute values of the state to prepare
         n (int): total number of qubits for the uniformly-controlled rotation
-        k (int): index of current qubit
 
     Returns:
-        array representing :math:`\alpha^{y,k}`
+        list[array]: the :math:`k-1`th entry represents :math:`\alpha^{y,k}`
     """
-    indices_numerator = [
-        [(2 * (j + 1) - 1) * 2 ** (k - 1) + l for l in range(2 ** (k - 1))]
-        for j in range(2 ** (n - k))
-    ]
-    numerator = np.take(a, indices=indices_numerator)
-    numerator = np.sum(np.abs(numerator) ** 2, axis=1)
-
-    indices_denominator = [[j * 2 ** k + l for l in range(2 ** k)] for j in range(2 ** (n - k))]
-    denominator = np.take(a, indices=indices_denominator)
-    denominator = np.sum(np.abs(denominator) ** 2, axis=1)
-
-    # Divide only where denominator is zero, else leave initial value of zero.
-    # The equation guarantees that the numerator is also zero in the corresponding entries.
-    division = np.divide(
-        numerator, denominator, out=np.zeros_like(numerator, dtype=float), where=denominator != 0.0
-    )
+    sums = a_sq
+    alphas = []
 
-    return 2 * np.arcsin(np.sqrt(division))
+    for _ in range(n):
+        # each row contains the sums over the two halves of a block of size 2^k
+        pairs = np.reshape(sums, (-1, 2))
+        sums = np.sum(pairs, axis=1)
+
+        # Divide only where denominator is zero, else leave initial value of zero.
+        # The equation guarantees that the numerator is also zero in the corresponding entries.
+        division = np.divide(
+            pairs[:, 1], sums, out=np.zeros_like(sums, dtype=float), where=sums != 0.0
+        )
+        alphas.append(2 * np.arcsin(np.sqrt(division)))
+
+    return alphas
 
 
 @template
@@ -260,8 +351,14 @@ def MottonenStatePreparation(state_vector, wires):
     if isinstance(state_vector[0], Variable):
         state_vector = np.array([s.val for s in state_vector])
 
+    # Work on the real and imaginary parts separately; the squared absolute values
+    # are reused below, and the square root of np.absolute is never needed.
+    re = np.real(state_vector)
+    im = np.imag(state_vector)
+    a_sq = re * re + im * im
+
     # check if normalized
-    norm = np.sum(np.abs(state_vector) ** 2)
+    norm = np.sum(a_sq)
     if not np.isclose(norm, 1.0, atol=1e-3):
         raise ValueError("'state_vector' has to be of length 1.0, got {}".format(norm))
 
@@ -270,20 +367,22 @@ def MottonenStatePreparation(state_vector, wires):
     # change ordering of wires, since original code was written for IBM machines
     wires_reverse = wires[::-1]
 
-    a = np.absolute(state_vector)
-    omega = np.angle(state_vector)
+    omega = np.arctan2(im, re)
+
+    alphas_y = _get_alpha_y(a_sq, n_wires)
+    alphas_z = _get_alpha_z(omega, n_wires)
+
+    # the control and target wires of the k-th uniformly controlled rotation are
+    # shared by both cascades, so they are only constructed once
+    controls = [wires_reverse[k:] for k in range(1, n_wires + 1)]
+    targets = [wires_reverse[k - 1] for k in range(1, n_wires + 1)]
 
     # Apply inverse y rotation cascade to prepare correct absolute values of amplitudes
     for k in range(n_wires, 0, -1):
-        alpha_y_k = _get_alpha_y(a, n_wires, k)
-        control = wires_reverse[k:]
-        target = wires_reverse[k - 1]
-        _uniform_rotation_dagger(qml.RY, alpha_y_k, control, target)
+        _uniform_rotation_dagger(qml.RY, alphas_y[k - 1], controls[k - 1], targets[k - 1])
 
     # Apply inverse z rotation cascade to prepare correct phases of amplitudes
     for k in range(n_wires, 0, -1):
-        alpha_z_k = _get_alpha_z(omega, n_wires, k)
-        control = wires_reverse[k:]
-        target = wires_reverse[k - 1]
+        alpha_z_k = alphas_z[k - 1]
         if len(alpha_z_k) > 0:
-            _uniform_rotation_dagger(qml.RZ, alpha_z_k, control, target)
+            _uniform_rotation_dagger(qml.RZ, alpha_z_k, controls[k - 1], targets[k - 1])
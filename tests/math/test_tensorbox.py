@@ -46,12 +46,25 @@ def test_creation_from_tensorbox():
     assert x is res
 
 
+def test_subclass_cached_by_type():
+    """Test that the TensorBox subclass is cached by tensor type"""
+    x = np.array([0.1, 0.2, 0.3])
+    res = qml.math.TensorBox(x)
+    assert isinstance(res, NumpyBox)
+    assert qml.math.tensorbox._BOX_BY_TYPE[np.ndarray] is NumpyBox
+
+    res = qml.math.TensorBox(np.array([0.4]))
+    assert isinstance(res, NumpyBox)
+
+
 def test_unknown_input_type():
     """Test that an exception is raised if the input type
     is unknown"""
     with pytest.raises(ValueError, match="Unknown tensor type"):
         qml.math.TensorBox("hello")
 
+    assert str not in qml.math.tensorbox._BOX_BY_TYPE
+
 
 def test_astensor():
     """Test conversion of sequences to numpy arrays"""
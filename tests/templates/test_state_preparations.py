@@ -26,12 +26,29 @@ import pennylane._queuing
 from pennylane.templates.state_preparations import (BasisStatePreparation,
                                                     MottonenStatePreparation,
                                                     ArbitraryStatePreparation)
-from pennylane.templates.state_preparations.mottonen import gray_code
+from pennylane.templates.state_preparations.mottonen import gray_code, gray_code_int
 from pennylane.templates.state_preparations.arbitrary_state_preparation import _state_preparation_pauli_words
-from pennylane.templates.state_preparations.mottonen import _get_alpha_y
+from pennylane.templates.state_preparations.mottonen import (
+    _get_alpha_y,
+    _get_alpha_z,
+    _compute_theta,
+    _bit_position,
+    _control_indices,
+)
 from pennylane.wires import Wires
 
 
+def _reference_m_trans(ln):
+    """Entry-wise evaluation of the matrix mapping alpha to theta, see Eq. (3) in
+    Möttönen et al. (2004)."""
+    M_trans = np.zeros((ln, ln))
+    for i in range(ln):
+        for j in range(ln):
+            M_trans[i, j] = (-1) ** bin(j & ((i >> 1) ^ i)).count("1")
+
+    return M_trans
+
+
 class TestHelperFunctions:
     """Tests the functionality of helper functions."""
 
@@ -48,6 +65,34 @@ class TestHelperFunctions:
 
         assert gray_code(rank) == expected_gray_code
 
+    @pytest.mark.parametrize("rank", [1, 2, 3, 4])
+    def test_gray_code_int(self, rank):
+        """Tests that the function gray_code_int agrees with the
+        binary strings generated by gray_code."""
+
+        expected = [int(code, 2) for code in gray_code(rank)]
+        assert gray_code_int(rank).tolist() == expected
+
+    def test_bit_position(self):
+        """Tests that the function _bit_position returns the position
+        of the set bit for all 32-bit powers of two."""
+
+        powers = [2 ** i for i in range(32)]
+        assert _bit_position(powers).tolist() == list(range(32))
+
+    # fmt: off
+    @pytest.mark.parametrize("rank,expected_indices", [
+        (1, (0, 0)),
+        (2, (0, 1, 0, 1)),
+        (3, (0, 1, 0, 2, 0, 1, 0, 2)),
+    ])
+    # fmt: on
+    def test_control_indices(self, rank, expected_indices):
+        """Tests that the function _control_indices returns the position of the
+        bit that changes between successive (cyclic) Gray codewords."""
+
+        assert _control_indices(rank) == expected_indices
+
     @pytest.mark.parametrize("num_wires,expected_pauli_words", [
         (1, ["X", "Y"]),
         (2, ["XI", "YI", "IX", "IY", "XX", "XY"]),
@@ -312,9 +357,72 @@ class TestMottonenStatePreparation:
         """Test the _get_alpha_y helper function."""
 
         state = np.array([np.sqrt(0.2), 0, np.sqrt(0.5), 0, 0, 0, np.sqrt(0.2), np.sqrt(0.1)])
-        res = _get_alpha_y(state, 3, current_qubit)
+        res = _get_alpha_y(np.abs(state) ** 2, 3)[current_qubit - 1]
         assert np.allclose(res, expected, atol=tol)
 
+    @pytest.mark.parametrize("current_qubit, expected", [
+        (1, np.array([-0.4, -0.8, 1.2, -3.1])),
+        (2, np.array([0.9, 0.35])),
+        (3, np.array([-0.075])),
+    ])
+    def test_get_alpha_z(self, current_qubit, expected, tol):
+        """Test the _get_alpha_z helper function."""
+
+        omega = np.array([0.1, -0.3, 1.2, 0.4, -0.5, 0.7, 2.0, -1.1])
+        res = _get_alpha_z(omega, 3)[current_qubit - 1]
+        assert np.allclose(res, expected, atol=tol)
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 4])
+    def test_compute_theta(self, n, tol):
+        """Test that the _compute_theta helper function agrees with an
+        entry-wise evaluation of the transformation matrix."""
+        ln = 2 ** n
+        alpha = np.linspace(-1.3, 2.1, ln)
+
+        res = _compute_theta(alpha)
+        assert type(res) is np.ndarray
+        assert np.allclose(res, _reference_m_trans(ln) @ alpha / ln, atol=tol)
+
+    def test_compute_theta_autograd(self, tol):
+        """Test that the _compute_theta helper function preserves trainable
+        PennyLane tensors and is differentiable with autograd."""
+        ln = 8
+        alpha = qml.numpy.linspace(-1.3, 2.1, ln, requires_grad=True)
+        M_trans = _reference_m_trans(ln)
+
+        res = _compute_theta(alpha)
+        assert isinstance(res, qml.numpy.tensor)
+        assert res.requires_grad
+        assert np.allclose(res, M_trans @ alpha / ln, atol=tol)
+
+        res = qml.jacobian(_compute_theta)(alpha)
+        assert np.allclose(res, M_trans / ln, atol=tol)
+
+    def test_gate_parameters_numpy(self):
+        """Test that the gate parameters are plain floats if the
+        state vector is a NumPy array."""
+        state_vector = np.array([0.5, 0.5j, 0.5, -0.5])
+
+        with qml.tape.QuantumTape() as tape:
+            MottonenStatePreparation(state_vector, wires=[0, 1])
+
+        params = [p for op in tape.operations for p in op.data]
+        assert len(params) == 5
+        assert not any(isinstance(p, qml.numpy.tensor) for p in params)
+
+    def test_gate_parameters_trainable(self):
+        """Test that the gate parameters are trainable PennyLane tensors
+        if the state vector is a trainable PennyLane tensor."""
+        state_vector = qml.numpy.array([0.5, 0.5j, 0.5, -0.5], requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            MottonenStatePreparation(state_vector, wires=[0, 1])
+
+        params = [p for op in tape.operations for p in op.data]
+        assert len(params) == 5
+        assert all(isinstance(p, qml.numpy.tensor) and p.requires_grad for p in params)
+        assert tape.trainable_params == set(range(5))
+
 
 class TestArbitraryStatePreparation:
     """Test the ArbitraryStatePreparation template."""
@@ -402,6 +402,36 @@ class TestNumpyIntegration:
         assert isinstance(res, np.tensor)
         assert res.requires_grad
 
+    def test_ufunc_multiple_outputs(self):
+        """Test that ufuncs with multiple outputs return a tuple of tensors."""
+        x = np.array([1.5, 2.25], requires_grad=False)
+        res = np.modf(x)
+        assert isinstance(res, tuple)
+        assert all(isinstance(r, np.tensor) for r in res)
+        assert all(not r.requires_grad for r in res)
+        assert onp.allclose(res[0], [0.5, 0.25])
+        assert onp.allclose(res[1], [1.0, 2.0])
+
+    def test_ufunc_out_argument(self):
+        """Test that ufuncs write to a provided output tensor."""
+        x = np.array([1.0, 2.0], requires_grad=True)
+        out = np.zeros([2], requires_grad=False)
+        res = onp.add(x, x, out=out)
+        assert isinstance(res, np.tensor)
+        assert res.requires_grad
+        assert onp.allclose(res, [2.0, 4.0])
+        assert onp.allclose(out, [2.0, 4.0])
+
+    def test_ufunc_reduction(self):
+        """Test that ufunc reductions return a tensor with the correct
+        trainability."""
+        x = np.array([1.0, 2.0, 3.0], requires_grad=False)
+        res = onp.add.reduce(x)
+        assert isinstance(res, np.tensor)
+        assert res.ndim == 0
+        assert res == 6.0
+        assert not res.requires_grad
+
 
 class TestAutogradIntegration:
     """Test autograd works with the new tensor subclass"""